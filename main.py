@@ -11,6 +11,7 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
 from etl import StockSentimentETL
 from eda import StockSentimentEDA
+from quality import DataQualityProfiler
 
 
 def main():
@@ -33,9 +34,17 @@ def main():
         
         # Ejecutar pipeline ETL
         etl.extract()
+        
+        # Perfilar calidad antes de las cargas (falla si se exceden umbrales)
+        profiler = DataQualityProfiler()
+        profiler.profile(etl.df)
+        profiler.save_report()
+        profiler.validate()
+        
         etl.transform()
         etl.load_csv()
         etl.load_parquet()
+        etl.load_feather()
         etl.load_sqlite()
         
         # Mostrar resumen
@@ -43,7 +52,7 @@ def main():
         print("\n📊 Resumen ETL:")
         print(f"  ✓ Registros procesados: {summary['total_rows']}")
         print(f"  ✓ Rango de fechas: {summary['date_range']['start']} a {summary['date_range']['end']}")
-        print(f"  ✓ Formatos generados: CSV, Parquet, SQLite")
+        print(f"  ✓ Formatos generados: CSV, Parquet, Feather, SQLite")
         
     except Exception as e:
         print(f"\n❌ Error en fase ETL: {str(e)}")
@@ -58,7 +67,7 @@ def main():
         # Inicializar EDA
         eda = StockSentimentEDA()
         
-        # Cargar datos limpios
+        # Cargar datos limpios (Feather con memory-map si está disponible)
         eda.load_data()
         
         # Generar todas las visualizaciones
@@ -66,6 +75,7 @@ def main():
         
         # Generar reporte
         eda.generate_summary_report()
+        eda.close()
         
     except Exception as e:
         print(f"\n❌ Error en fase EDA: {str(e)}")
@@ -79,7 +89,9 @@ def main():
     print("  📊 Datos limpios:")
     print("     • data/stock_sentiment_clean.csv")
     print("     • data/stock_sentiment_clean.parquet")
+    print("     • data/stock_sentiment_clean.feather")
     print("     • data/stock_sentiment.db")
+    print("     • data/quality_report.json")
     print("\n  📈 Visualizaciones:")
     print("     • visualizations/01_sentiment_distribution.png")
     print("     • visualizations/02_temporal_trend.png")
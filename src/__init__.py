@@ -8,5 +8,6 @@ __author__ = 'Sean Osorio'
 
 from .etl import StockSentimentETL
 from .eda import StockSentimentEDA
+from .quality import DataQualityProfiler
 
-__all__ = ['StockSentimentETL', 'StockSentimentEDA']
+__all__ = ['StockSentimentETL', 'StockSentimentEDA', 'DataQualityProfiler']
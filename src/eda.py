@@ -7,38 +7,169 @@ import pandas as pd
 import numpy as np
 import matplotlib.pyplot as plt
 import seaborn as sns
+import pyarrow as pa
 from wordcloud import WordCloud
 import os
 from datetime import datetime
 
 
+class LazyArrowFrame:
+    """
+    Vista sobre una tabla Arrow con memory-map que se comporta como un DataFrame.
+    
+    Cada columna se convierte a pandas la primera vez que se accede con
+    df['col'] o df[['a', 'b']] y queda en caché; las columnas que nunca se usan
+    (p. ej. los titulares Top1-Top25) no se materializan. Cualquier otra
+    operación de DataFrame (head, describe, iloc, groupby, asignar columnas...)
+    materializa la tabla completa una sola vez con to_pandas() y se delega en
+    ese DataFrame.
+    """
+    
+    def __init__(self, table):
+        """
+        Args:
+            table (pa.Table): Tabla Arrow respaldada por el archivo mapeado
+        """
+        self._table = table
+        self._cache = {}
+        self._frame = None
+    
+    @property
+    def columns(self):
+        if self._frame is not None:
+            return self._frame.columns
+        return pd.Index(self._table.column_names)
+    
+    @property
+    def shape(self):
+        if self._frame is not None:
+            return self._frame.shape
+        return (self._table.num_rows, self._table.num_columns)
+    
+    def __len__(self):
+        return self._table.num_rows
+    
+    def __contains__(self, name):
+        return name in self.columns
+    
+    def __iter__(self):
+        return iter(self.columns)
+    
+    def __repr__(self):
+        return repr(self.to_pandas())
+    
+    def _column(self, name):
+        if name not in self._cache:
+            column = self._table.column(name)
+            # Con un solo bloque, los tipos numéricos sin nulos se comparten con el mapeo
+            if column.num_chunks == 1:
+                column = column.chunk(0)
+            series = column.to_pandas()
+            # Asignar el nombre en sitio: rename() copiaría los datos
+            series.name = name
+            self._cache[name] = series
+        return self._cache[name]
+    
+    def __getitem__(self, key):
+        """
+        Solo un nombre de columna o una lista/Index de nombres se resuelven de
+        forma perezosa; cualquier otra clave (máscara booleana, slice,
+        callable...) se aplica sobre el DataFrame completo, como en pandas
+        
+        Args:
+            key: Clave de indexación de pandas
+        
+        Returns:
+            pd.Series | pd.DataFrame: Resultado de df[key]
+        """
+        if self._frame is None:
+            names = self._table.column_names
+            if isinstance(key, str) and key in names:
+                return self._column(key)
+            if isinstance(key, (list, pd.Index)) and all(
+                    isinstance(name, str) and name in names for name in key):
+                return pd.concat([self._column(name) for name in key], axis=1)
+        return self.to_pandas()[key]
+    
+    def __setitem__(self, key, value):
+        self.to_pandas()[key] = value
+    
+    def __getattr__(self, name):
+        # Solo se llama si el atributo no existe en la clase: se delega en el DataFrame
+        if name.startswith('_'):
+            raise AttributeError(name)
+        return getattr(self.to_pandas(), name)
+    
+    def to_pandas(self):
+        """
+        Materializa todas las columnas en un DataFrame (una sola vez)
+        
+        Returns:
+            pd.DataFrame: DataFrame con todas las columnas
+        """
+        if self._frame is None:
+            self._frame = pd.concat([self._column(name) for name in self._table.column_names], axis=1)
+        return self._frame
+
+
 class StockSentimentEDA:
     """
     Clase para realizar análisis exploratorio de datos
     """
     
-    def __init__(self, data_path='data/stock_sentiment_clean.csv'):
+    def __init__(self, data_path='data/stock_sentiment_clean.csv',
+                 feather_path=None, use_feather=True):
         """
         Inicializa el EDA con los datos limpios
         
         Args:
             data_path (str): Ruta del archivo de datos limpios
+            feather_path (str): Ruta del caché Feather generado por el ETL
+                (None = misma ruta que data_path con extensión .feather)
+            use_feather (bool): False para leer siempre el CSV
         """
         self.data_path = data_path
+        if feather_path is None:
+            feather_path = os.path.splitext(data_path)[0] + '.feather'
+        self.feather_path = feather_path if use_feather else None
         self.df = None
+        self._feather_source = None
         self.output_dir = 'visualizations'
         
         # Configurar estilo de visualizaciones
         plt.style.use('seaborn-v0_8-darkgrid')
         sns.set_palette("husl")
         
+    def _feather_is_fresh(self):
+        """
+        Indica si el caché Feather existe y no es más antiguo que el CSV
+        """
+        if not self.feather_path or not os.path.exists(self.feather_path):
+            return False
+        if not os.path.exists(self.data_path):
+            return True
+        return os.path.getmtime(self.feather_path) >= os.path.getmtime(self.data_path)
+    
     def load_data(self):
         """
-        Carga los datos limpios
+        Carga los datos limpios. Usa el caché Feather con memory-map si está
+        disponible (tipos ya convertidos, columnas materializadas bajo demanda);
+        si no, parsea el CSV
+        
+        Returns:
+            pd.DataFrame | LazyArrowFrame: Con el caché Feather se devuelve un
+            LazyArrowFrame; df['col'] y df[[...]] son perezosos y el resto de
+            operaciones de DataFrame materializan la tabla con to_pandas()
         """
-        print(f"📥 Cargando datos desde: {self.data_path}")
-        self.df = pd.read_csv(self.data_path)
-        self.df['Date'] = pd.to_datetime(self.df['Date'])
+        self.close()
+        if self._feather_is_fresh():
+            print(f"📥 Cargando datos desde: {self.feather_path} (memory-map)")
+            self._feather_source = pa.memory_map(self.feather_path, 'r')
+            self.df = LazyArrowFrame(pa.ipc.open_file(self._feather_source).read_all())
+        else:
+            print(f"📥 Cargando datos desde: {self.data_path}")
+            self.df = pd.read_csv(self.data_path)
+            self.df['Date'] = pd.to_datetime(self.df['Date'])
         print(f"✅ Datos cargados: {self.df.shape[0]} filas, {self.df.shape[1]} columnas")
         
         # Crear directorio de salida
@@ -46,6 +177,16 @@ class StockSentimentEDA:
         
         return self.df
     
+    def close(self):
+        """
+        Libera el memory-map del caché Feather, si está abierto. En Windows el
+        archivo queda bloqueado mientras el mapeo siga abierto
+        """
+        if self._feather_source is not None:
+            self.df = None
+            self._feather_source.close()
+            self._feather_source = None
+    
     def plot_sentiment_distribution(self):
         """
         Gráfica 1: Distribución de sentimientos (Label)
@@ -89,7 +230,7 @@ class StockSentimentEDA:
         print("\n📊 Generando gráfica 2: Tendencia temporal...")
         
         # Agrupar por fecha y sentimiento
-        temporal_data = self.df.groupby([pd.Grouper(key='Date', freq='M'), 'Label']).size().unstack(fill_value=0)
+        temporal_data = self.df[['Date', 'Label']].groupby([pd.Grouper(key='Date', freq='M'), 'Label']).size().unstack(fill_value=0)
         
         fig, ax = plt.subplots(figsize=(16, 6))
         
@@ -115,7 +256,7 @@ class StockSentimentEDA:
         """
         print("\n📊 Generando gráfica 3: Sentimientos por año...")
         
-        yearly_data = self.df.groupby(['Year', 'Label']).size().unstack(fill_value=0)
+        yearly_data = self.df[['Year', 'Label']].groupby(['Year', 'Label']).size().unstack(fill_value=0)
         
         fig, ax = plt.subplots(figsize=(12, 6))
         
@@ -156,7 +297,7 @@ class StockSentimentEDA:
         """
         print("\n📊 Generando gráfica 4: Patrón por día de semana...")
         
-        weekday_data = self.df.groupby(['DayOfWeek', 'Label']).size().unstack(fill_value=0)
+        weekday_data = self.df[['DayOfWeek', 'Label']].groupby(['DayOfWeek', 'Label']).size().unstack(fill_value=0)
         weekday_names = ['Lunes', 'Martes', 'Miércoles', 'Jueves', 'Viernes', 'Sábado', 'Domingo']
         
         fig, axes = plt.subplots(2, 1, figsize=(12, 10))
@@ -211,7 +352,7 @@ class StockSentimentEDA:
         axes[0, 0].legend()
         
         # Boxplot por sentimiento
-        self.df.boxplot(column='News_Count', by='Label', ax=axes[0, 1], 
+        self.df[['News_Count', 'Label']].boxplot(column='News_Count', by='Label', ax=axes[0, 1], 
                        patch_artist=True, grid=False)
         axes[0, 1].set_xlabel('Sentimiento', fontsize=11, fontweight='bold')
         axes[0, 1].set_ylabel('Número de Noticias', fontsize=11, fontweight='bold')
@@ -221,7 +362,7 @@ class StockSentimentEDA:
         plt.xticks(rotation=0)
         
         # Tendencia temporal de noticias
-        news_by_month = self.df.groupby(pd.Grouper(key='Date', freq='M'))['News_Count'].mean()
+        news_by_month = self.df[['Date', 'News_Count']].groupby(pd.Grouper(key='Date', freq='M'))['News_Count'].mean()
         axes[1, 0].plot(news_by_month.index, news_by_month.values, 
                        color='#27ae60', linewidth=2, marker='o', markersize=4)
         axes[1, 0].set_xlabel('Fecha', fontsize=11, fontweight='bold')
@@ -262,7 +403,7 @@ class StockSentimentEDA:
         print("\n📊 Generando gráfica BONUS: Mapa de calor trimestral...")
         
         # Crear pivot table
-        quarterly_data = self.df.pivot_table(
+        quarterly_data = self.df[['Label', 'Year', 'Quarter']].pivot_table(
             values='Label', 
             index='Year', 
             columns='Quarter', 
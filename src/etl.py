@@ -6,10 +6,39 @@ Extrae, Transforma y Carga datos del análisis de sentimiento de acciones del Do
 import pandas as pd
 import numpy as np
 import sqlite3
+import pyarrow.feather as feather
 from datetime import datetime
 import os
 
 
+# Codificaciones a probar, en orden, al leer el CSV de entrada
+ENCODINGS = ['utf-8', 'latin-1', 'iso-8859-1', 'cp1252']
+
+
+def detect_encoding(input_file, encodings=ENCODINGS, block_size=1 << 20):
+    """
+    Devuelve la primera codificación capaz de decodificar todo el archivo.
+    Lee por bloques, sin cargar el archivo completo en memoria
+    
+    Args:
+        input_file (str): Ruta del archivo
+        encodings (list): Codificaciones a probar, en orden
+        block_size (int): Caracteres leídos por bloque
+    
+    Returns:
+        str: Codificación válida, o None si ninguna funciona
+    """
+    for encoding in encodings:
+        try:
+            with open(input_file, encoding=encoding) as f:
+                while f.read(block_size):
+                    pass
+            return encoding
+        except UnicodeDecodeError:
+            continue
+    return None
+
+
 class StockSentimentETL:
     """
     Clase para realizar el proceso ETL sobre los datos de sentimiento de acciones
@@ -36,15 +65,12 @@ class StockSentimentETL:
         print(f"📥 Extrayendo datos de: {self.input_file}")
         try:
             # Intentar con diferentes codificaciones
-            encodings = ['utf-8', 'latin-1', 'iso-8859-1', 'cp1252']
-            for encoding in encodings:
-                try:
-                    self.df = pd.read_csv(self.input_file, encoding=encoding)
-                    print(f"✅ Datos extraídos exitosamente con codificación '{encoding}'")
-                    print(f"   {self.df.shape[0]} filas, {self.df.shape[1]} columnas")
-                    return self.df
-                except UnicodeDecodeError:
-                    continue
+            encoding = detect_encoding(self.input_file)
+            if encoding is not None:
+                self.df = pd.read_csv(self.input_file, encoding=encoding)
+                print(f"✅ Datos extraídos exitosamente con codificación '{encoding}'")
+                print(f"   {self.df.shape[0]} filas, {self.df.shape[1]} columnas")
+                return self.df
             
             # Si ninguna codificación funciona, usar errors='ignore'
             self.df = pd.read_csv(self.input_file, encoding='latin-1', errors='ignore')
@@ -114,9 +140,7 @@ class StockSentimentETL:
         self.df_clean['Quarter'] = self.df_clean['Date'].dt.quarter
         
         # Contar noticias por día
-        self.df_clean['News_Count'] = self.df_clean[top_cols].apply(
-            lambda row: sum(1 for val in row if val != ''), axis=1
-        )
+        self.df_clean['News_Count'] = self._count_news(self.df_clean, top_cols)
         
         print(f"\n✅ Transformación completada: {self.df_clean.shape[0]} filas limpias")
         print(f"\n📊 Resumen de datos limpios:")
@@ -127,6 +151,20 @@ class StockSentimentETL:
         
         return self.df_clean
     
+    @staticmethod
+    def _count_news(df, top_cols):
+        """
+        Cuenta los titulares no vacíos por fila en una sola comparación vectorizada
+        
+        Args:
+            df (pd.DataFrame): Datos con las columnas TopN rellenadas con ''
+            top_cols (list): Columnas de titulares
+        
+        Returns:
+            pd.Series: Número de noticias por fila
+        """
+        return (df[top_cols] != '').sum(axis=1)
+    
     def load_csv(self, output_path='data/stock_sentiment_clean.csv'):
         """
         Carga el dataset limpio en formato CSV
@@ -157,6 +195,23 @@ class StockSentimentETL:
         self.df_clean.to_parquet(output_path, index=False, engine='pyarrow')
         print(f"✅ Archivo Parquet guardado exitosamente")
     
+    def load_feather(self, output_path='data/stock_sentiment_clean.feather'):
+        """
+        Carga el dataset limpio en formato Feather (Arrow IPC) sin compresión,
+        para que el EDA lo abra con memory-map sin volver a parsear ni copiar
+        
+        Args:
+            output_path (str): Ruta del archivo de salida
+        """
+        if self.df_clean is None:
+            raise ValueError("Primero debe ejecutar transform()")
+        
+        print(f"\n💾 Guardando datos limpios en Feather: {output_path}")
+        os.makedirs(os.path.dirname(output_path), exist_ok=True)
+        # Sin compresión: los buffers en disco son los mismos que se leen en memoria
+        feather.write_feather(self.df_clean, output_path, compression='uncompressed')
+        print(f"✅ Archivo Feather guardado exitosamente")
+    
     def load_sqlite(self, db_path='data/stock_sentiment.db', table_name='stock_sentiment'):
         """
         Carga el dataset limpio en una tabla SQLite
@@ -230,6 +285,7 @@ def main():
     # Cargar en múltiples formatos
     etl.load_csv()
     etl.load_parquet()
+    etl.load_feather()
     etl.load_sqlite()
     
     # Mostrar resumen
@@ -0,0 +1,341 @@
+"""
+Data Quality Module for Stock Sentiment Analysis
+Perfilado de calidad de datos previo a la carga (titulares, fechas, codificación)
+"""
+
+import pandas as pd
+import numpy as np
+import json
+import os
+
+try:
+    from .etl import detect_encoding
+except ImportError:
+    # Ejecución como script (python src/quality.py) o desde main.py
+    from etl import detect_encoding
+
+
+# Umbrales por defecto. Un valor None desactiva la verificación correspondiente.
+DEFAULT_THRESHOLDS = {
+    'max_invalid_date_ratio': 0.01,   # Fechas que no se pueden convertir
+    'max_label_null_ratio': 0.0,      # Label nulo rompe astype(int) en transform(); se cuenta en todas las filas
+    'max_empty_slot_ratio': 0.10,     # Posiciones TopN vacías o nulas
+    'max_mojibake_ratio': 0.05,       # Titulares con texto mal decodificado
+    'max_bytes_prefix_ratio': None,   # Titulares con prefijo b'...' (solo se reporta)
+    'max_date_gap_days': 31,          # Mayor salto entre fechas consecutivas
+    'max_long_gaps': None,            # Saltos mayores a LONG_GAP_DAYS (solo se reporta)
+}
+
+# Un salto de más de 4 días no se explica por un fin de semana más un festivo
+LONG_GAP_DAYS = 4
+
+# Secuencias típicas de UTF-8 decodificado como latin-1/cp1252
+MOJIBAKE_PATTERN = r'Ã.|Â.|â€|ï¿½|�'
+BYTES_PREFIX_PATTERN = r'^\s*b[\'"]'
+
+
+class DataQualityProfiler:
+    """
+    Clase para perfilar la calidad de los datos crudos antes de transformarlos
+    """
+
+    def __init__(self, thresholds=None, sample_size=None, random_state=42):
+        """
+        Inicializa el perfilador
+
+        Args:
+            thresholds (dict): Umbrales que sobrescriben DEFAULT_THRESHOLDS
+            sample_size (int): Tamaño de la muestra reservoir (None = datos completos)
+            random_state (int): Semilla para el muestreo
+        """
+        self.thresholds = dict(DEFAULT_THRESHOLDS)
+        if thresholds:
+            self.thresholds.update(thresholds)
+        self.sample_size = sample_size
+        self.random_state = random_state
+        self.report = None
+
+    def profile(self, df):
+        """
+        Perfila un DataFrame ya cargado en memoria
+
+        Args:
+            df (pd.DataFrame): Datos crudos (salida de extract())
+
+        Returns:
+            dict: Reporte de calidad
+        """
+        print("\n🔬 Perfilando calidad de datos...")
+        total_rows = len(df)
+        dates = df['Date'] if 'Date' in df.columns else pd.Series(dtype=object)
+        label_nulls = int(df['Label'].isnull().sum()) if 'Label' in df.columns else None
+
+        sample = df
+        if self.sample_size is not None and total_rows > self.sample_size:
+            sample = self._reservoir_sample([df])
+
+        self.report = self._build_report(sample, dates, total_rows, label_nulls)
+        return self.report
+
+    def profile_csv(self, input_file, chunksize=100000, encoding=None):
+        """
+        Perfila un CSV por bloques sin cargarlo completo en memoria.
+
+        La columna Date se lee completa (es pequeña y los saltos de fechas
+        necesitan todas las filas) y los nulos de Label se cuentan en todos los
+        bloques; el resto de estadísticas se calcula sobre la muestra reservoir
+        si sample_size está definido.
+
+        Args:
+            input_file (str): Ruta del archivo CSV
+            chunksize (int): Filas por bloque
+            encoding (str): Codificación del archivo (None = detectar igual que
+                StockSentimentETL.extract())
+
+        Returns:
+            dict: Reporte de calidad
+        """
+        print(f"\n🔬 Perfilando calidad de datos por bloques: {input_file}")
+        if encoding is None:
+            encoding = detect_encoding(input_file) or 'latin-1'
+        date_parts = []
+        total_rows = 0
+        label_nulls = None
+
+        def chunks():
+            nonlocal total_rows, label_nulls
+            for chunk in pd.read_csv(input_file, chunksize=chunksize, encoding=encoding):
+                total_rows += len(chunk)
+                if 'Date' in chunk.columns:
+                    date_parts.append(chunk['Date'])
+                if 'Label' in chunk.columns:
+                    label_nulls = (label_nulls or 0) + int(chunk['Label'].isnull().sum())
+                yield chunk
+
+        if self.sample_size is not None:
+            sample = self._reservoir_sample(chunks())
+        else:
+            sample = pd.concat(list(chunks()), ignore_index=True)
+
+        dates = pd.concat(date_parts, ignore_index=True) if date_parts else pd.Series(dtype=object)
+        self.report = self._build_report(sample, dates, total_rows, label_nulls)
+        return self.report
+
+    def _reservoir_sample(self, chunks):
+        """
+        Muestreo reservoir (algoritmo R) vectorizado por bloque
+
+        Args:
+            chunks (iterable): Bloques de pd.DataFrame
+
+        Returns:
+            pd.DataFrame: Muestra uniforme de hasta sample_size filas
+        """
+        rng = np.random.default_rng(self.random_state)
+        k = self.sample_size
+        reservoir = None
+        seen = 0
+
+        for chunk in chunks:
+            chunk = chunk.reset_index(drop=True)
+            n = len(chunk)
+
+            # Llenar el reservoir con las primeras k filas
+            fill = 0
+            if reservoir is None or len(reservoir) < k:
+                fill = min(k - (0 if reservoir is None else len(reservoir)), n)
+                head = chunk.iloc[:fill].astype(object)
+                reservoir = head if reservoir is None else pd.concat([reservoir, head], ignore_index=True)
+
+            # Reemplazos: la fila global i sustituye a la posición j < k con probabilidad k/(i+1)
+            if fill < n:
+                positions = np.arange(seen + fill, seen + n)
+                j = rng.integers(0, positions + 1)
+                hit = j < k
+                if hit.any():
+                    # Si varias filas caen en la misma posición gana la última, como en el algoritmo secuencial
+                    replacements = pd.Series(np.flatnonzero(hit) + fill, index=j[hit])
+                    replacements = replacements[~replacements.index.duplicated(keep='last')]
+                    reservoir.iloc[replacements.index.to_numpy()] = chunk.iloc[replacements.to_numpy()].to_numpy()
+
+            seen += n
+
+        if reservoir is None:
+            return pd.DataFrame()
+        return reservoir
+
+    def _build_report(self, sample, dates, total_rows, label_nulls=None):
+        """
+        Calcula todas las métricas en una sola pasada vectorizada.
+
+        Las métricas que dependen de las filas perfiladas (nulos, titulares,
+        distribución de Label) van bajo 'sample'; si sample_size está activo
+        son conteos sobre la muestra, no sobre el total. 'dates' y 'label'
+        (nulos de Label) siempre usan todas las filas
+
+        Args:
+            sample (pd.DataFrame): Filas a perfilar (completas o muestreadas)
+            dates (pd.Series): Columna Date completa
+            total_rows (int): Total de filas del origen
+            label_nulls (int): Nulos de Label en todas las filas (None si no hay Label)
+
+        Returns:
+            dict: Reporte de calidad
+        """
+        top_cols = [c for c in (f'Top{i}' for i in range(1, 26)) if c in sample.columns]
+        n_sample = len(sample)
+
+        stats = {
+            'sampled': n_sample < total_rows,
+            'sample_size': self.sample_size,
+            'rows': int(n_sample),
+            'missing_values': {c: int(v) for c, v in sample.isnull().sum().items()},
+        }
+        report = {
+            'total_rows': int(total_rows),
+            'sample': stats,
+        }
+
+        # ---- Titulares: una sola Series con todas las celdas TopN ----
+        if top_cols and n_sample:
+            cells = pd.Series(sample[top_cols].to_numpy().ravel(), dtype=object)
+            text = cells.where(cells.notna(), '').astype(str)
+            lengths = text.str.len().to_numpy()
+            empty = (text.str.strip() == '').to_numpy()
+            mojibake = text.str.contains(MOJIBAKE_PATTERN, regex=True).to_numpy()
+            bytes_prefix = text.str.contains(BYTES_PREFIX_PATTERN, regex=True).to_numpy()
+
+            shape = (n_sample, len(top_cols))
+            empty_by_pos = empty.reshape(shape).sum(axis=0)
+            filled = lengths[~empty]
+            n_cells = cells.size
+
+            stats['headlines'] = {
+                'cells': int(n_cells),
+                'length': {
+                    'mean': float(filled.mean()) if filled.size else 0.0,
+                    'min': int(filled.min()) if filled.size else 0,
+                    'max': int(filled.max()) if filled.size else 0,
+                    'p50': float(np.percentile(filled, 50)) if filled.size else 0.0,
+                    'p95': float(np.percentile(filled, 95)) if filled.size else 0.0,
+                },
+                'empty_slots': int(empty.sum()),
+                'empty_slot_ratio': float(empty.sum() / n_cells),
+                'empty_slots_by_position': {c: int(v) for c, v in zip(top_cols, empty_by_pos)},
+                'mojibake': int(mojibake.sum()),
+                'mojibake_ratio': float(mojibake.sum() / n_cells),
+                'bytes_prefix': int(bytes_prefix.sum()),
+                'bytes_prefix_ratio': float(bytes_prefix.sum() / n_cells),
+            }
+
+        # ---- Label: nulos sobre todas las filas, distribución sobre la muestra ----
+        if label_nulls is not None and total_rows:
+            report['label'] = {
+                'nulls': int(label_nulls),
+                'null_ratio': float(label_nulls / total_rows),
+            }
+        if 'Label' in sample.columns and n_sample:
+            stats['label'] = {
+                'distribution': {str(k): int(v) for k, v in sample['Label'].value_counts().items()},
+            }
+
+        # ---- Fechas (siempre sobre la columna completa) ----
+        if len(dates):
+            parsed = pd.to_datetime(dates, errors='coerce')
+            invalid = int(parsed.isnull().sum())
+            unique_dates = pd.Series(parsed.dropna().unique()).sort_values()
+            gaps = unique_dates.diff().dt.days.dropna()
+            report['dates'] = {
+                'invalid': invalid,
+                'invalid_ratio': float(invalid / len(dates)),
+                'duplicated': int(parsed.dropna().duplicated().sum()),
+                'start': str(unique_dates.min()) if len(unique_dates) else None,
+                'end': str(unique_dates.max()) if len(unique_dates) else None,
+                'max_gap_days': int(gaps.max()) if len(gaps) else 0,
+                'long_gap_days': LONG_GAP_DAYS,
+                'long_gaps': int((gaps > LONG_GAP_DAYS).sum()),
+            }
+
+        report['violations'] = self._check_thresholds(report)
+        return report
+
+    def _check_thresholds(self, report):
+        """
+        Compara el reporte contra los umbrales configurados
+
+        Args:
+            report (dict): Reporte de calidad
+
+        Returns:
+            list: Descripción de cada umbral excedido
+        """
+        dates = report.get('dates', {})
+        label = report.get('label', {})
+        headlines = report['sample'].get('headlines', {})
+        checks = [
+            ('max_invalid_date_ratio', dates.get('invalid_ratio')),
+            ('max_label_null_ratio', label.get('null_ratio')),
+            ('max_empty_slot_ratio', headlines.get('empty_slot_ratio')),
+            ('max_mojibake_ratio', headlines.get('mojibake_ratio')),
+            ('max_bytes_prefix_ratio', headlines.get('bytes_prefix_ratio')),
+            ('max_date_gap_days', dates.get('max_gap_days')),
+            ('max_long_gaps', dates.get('long_gaps')),
+        ]
+
+        violations = []
+        for name, value in checks:
+            limit = self.thresholds.get(name)
+            if limit is not None and value is not None and value > limit:
+                violations.append(f"{name}: {value:.4g} > {limit}")
+        return violations
+
+    def save_report(self, output_path='data/quality_report.json'):
+        """
+        Guarda el reporte de calidad en formato JSON
+
+        Args:
+            output_path (str): Ruta del archivo de salida
+        """
+        if self.report is None:
+            raise ValueError("Primero debe ejecutar profile() o profile_csv()")
+
+        print(f"\n💾 Guardando reporte de calidad: {output_path}")
+        os.makedirs(os.path.dirname(output_path), exist_ok=True)
+        with open(output_path, 'w', encoding='utf-8') as f:
+            json.dump(self.report, f, indent=2, ensure_ascii=False)
+        print(f"✅ Reporte de calidad guardado exitosamente")
+
+    def validate(self):
+        """
+        Falla si algún umbral fue excedido
+
+        Raises:
+            ValueError: Si el reporte contiene violaciones
+        """
+        if self.report is None:
+            raise ValueError("Primero debe ejecutar profile() o profile_csv()")
+
+        violations = self.report['violations']
+        if violations:
+            for v in violations:
+                print(f"  ❌ {v}")
+            raise ValueError(f"Calidad de datos insuficiente: {len(violations)} umbral(es) excedido(s)")
+        print("✅ Calidad de datos dentro de los umbrales")
+
+
+def main():
+    """
+    Función principal para perfilar los datos crudos
+    """
+    print("=" * 80)
+    print("🔬 STOCK SENTIMENT ANALYSIS - DATA QUALITY PROFILE")
+    print("=" * 80)
+
+    profiler = DataQualityProfiler()
+    profiler.profile_csv('stock_senti_analysis.csv')
+    profiler.save_report()
+    profiler.validate()
+
+
+if __name__ == "__main__":
+    main()
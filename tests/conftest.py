@@ -0,0 +1,229 @@
+"""
+Fixtures compartidos: datos sintéticos con semilla fija y medición de presupuestos
+de tiempo y memoria contra la línea base en tests/perf_baseline.json
+"""
+
+import ctypes
+import gc
+import json
+import os
+import sys
+import threading
+import time
+import tracemalloc
+
+import matplotlib
+matplotlib.use('Agg')
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pytest
+
+# Igual que main.py: los módulos se importan desde src/
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+
+SEED = 42
+N_ROWS = 2000
+BASELINE_PATH = os.path.join(os.path.dirname(__file__), 'perf_baseline.json')
+
+# Holgura relativa sobre la línea base; configurables por variable de entorno
+TIME_TOLERANCE = float(os.environ.get('PERF_TIME_TOLERANCE', '1.0'))
+MEMORY_TOLERANCE = float(os.environ.get('PERF_MEMORY_TOLERANCE', '0.25'))
+# Holgura absoluta para etapas muy rápidas, donde el ruido domina
+TIME_FLOOR_SECONDS = 0.05
+MEMORY_FLOOR_MB = 1.0
+# El RSS incluye ruido del asignador y de páginas compartidas
+RSS_FLOOR_MB = 8.0
+# Intervalo de muestreo de memoria nativa (Arrow, RSS)
+SAMPLE_INTERVAL_SECONDS = 0.002
+
+UPDATE_BASELINE = os.environ.get('PERF_UPDATE_BASELINE') == '1'
+
+_measurements = {}
+
+
+def make_raw_dataframe(n_rows=N_ROWS, seed=SEED):
+    """
+    Genera datos con la forma de stock_senti_analysis.csv: Date, Label y
+    Top1-Top25, con duplicados, fechas nulas, titulares vacíos, prefijos b'...'
+    y algo de mojibake
+
+    Args:
+        n_rows (int): Número de filas antes de añadir duplicados
+        seed (int): Semilla del generador
+
+    Returns:
+        pd.DataFrame: Datos crudos sintéticos
+    """
+    rng = np.random.default_rng(seed)
+    dates = pd.bdate_range('2008-08-08', periods=n_rows).strftime('%Y-%m-%d').to_numpy(dtype=object)
+    dates[rng.choice(n_rows, size=5, replace=False)] = None
+
+    df = pd.DataFrame({'Date': dates, 'Label': rng.integers(0, 2, n_rows)})
+
+    words = np.array(['market', 'stocks', 'oil', 'war', 'election', 'bank', 'crisis',
+                      'growth', 'rates', 'china', 'europe', 'trade', 'tech', 'jobs'])
+    for i in range(1, 26):
+        n_words = rng.integers(3, 15, n_rows)
+        headlines = np.array([' '.join(rng.choice(words, size=k)) for k in n_words], dtype=object)
+        prefixed = rng.random(n_rows) < 0.3
+        headlines[prefixed] = np.array([f"b'{h}'" for h in headlines[prefixed]], dtype=object)
+        headlines[rng.random(n_rows) < 0.01] = 'CafÃ© news'
+        headlines[rng.random(n_rows) < 0.03] = None
+        df[f'Top{i}'] = headlines
+
+    # Filas duplicadas que transform() debe eliminar
+    return pd.concat([df, df.iloc[:20]], ignore_index=True)
+
+
+@pytest.fixture(scope='session')
+def raw_df():
+    return make_raw_dataframe()
+
+
+@pytest.fixture(scope='session')
+def raw_csv(tmp_path_factory, raw_df):
+    path = tmp_path_factory.mktemp('raw') / 'stock_senti_analysis.csv'
+    raw_df.to_csv(path, index=False)
+    return str(path)
+
+
+def _load_baseline():
+    if not os.path.exists(BASELINE_PATH):
+        return {}
+    with open(BASELINE_PATH, encoding='utf-8') as f:
+        return json.load(f)
+
+
+@pytest.fixture(scope='session')
+def baseline():
+    return _load_baseline()
+
+
+def _rss_bytes():
+    """
+    RSS actual del proceso leído de /proc (None fuera de Linux)
+    """
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, AttributeError):
+        return None
+
+
+def _trim_heap():
+    """
+    Devuelve al sistema la memoria libre del heap (glibc) para que el RSS de
+    cada etapa no dependa de lo que dejaron las anteriores
+    """
+    gc.collect()
+    try:
+        ctypes.CDLL('libc.so.6').malloc_trim(0)
+    except (OSError, AttributeError):
+        pass
+
+
+class _NativeMemorySampler(threading.Thread):
+    """
+    Muestrea en segundo plano el pool de Arrow y el RSS para obtener el pico
+    de memoria nativa, que tracemalloc no ve (buffers de Arrow, Agg, etc.)
+    """
+
+    def __init__(self):
+        super().__init__(daemon=True)
+        self._done = threading.Event()
+        self.arrow_start = pa.total_allocated_bytes()
+        self.arrow_peak = self.arrow_start
+        self.rss_start = _rss_bytes()
+        self.rss_peak = self.rss_start
+
+    def _sample(self):
+        self.arrow_peak = max(self.arrow_peak, pa.total_allocated_bytes())
+        if self.rss_start is not None:
+            self.rss_peak = max(self.rss_peak, _rss_bytes())
+
+    def run(self):
+        while not self._done.wait(SAMPLE_INTERVAL_SECONDS):
+            self._sample()
+
+    def stop(self):
+        self._done.set()
+        self.join()
+        self._sample()
+
+
+def _check(stage, metric, measured, expected, tolerance, floor):
+    limit = max(expected * (1 + tolerance), expected + floor)
+    assert measured <= limit, (
+        f"{stage}: {metric}={measured:.3f} excede el presupuesto de {limit:.3f} "
+        f"(línea base {expected:.3f})")
+
+
+@pytest.fixture
+def budget(baseline):
+    """
+    Devuelve una función que ejecuta una etapa, mide su tiempo y sus picos de
+    memoria y los compara con la línea base:
+
+    - peak_mb: heap de Python (tracemalloc)
+    - arrow_peak_mb: pool de memoria de Arrow, sobre el valor inicial
+    - rss_peak_mb: RSS del proceso sobre el valor inicial (solo Linux);
+      incluye buffers nativos como los de matplotlib/Agg
+    """
+    def run(stage, func, *args, **kwargs):
+        _trim_heap()
+        sampler = _NativeMemorySampler()
+        sampler.start()
+        tracemalloc.start()
+        start = time.perf_counter()
+        try:
+            result = func(*args, **kwargs)
+        finally:
+            seconds = time.perf_counter() - start
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            sampler.stop()
+
+        mb = 1024 * 1024
+        measured = {
+            'seconds': round(seconds, 4),
+            'peak_mb': round(peak / mb, 3),
+            'arrow_peak_mb': round((sampler.arrow_peak - sampler.arrow_start) / mb, 3),
+        }
+        if sampler.rss_start is not None:
+            measured['rss_peak_mb'] = round((sampler.rss_peak - sampler.rss_start) / mb, 3)
+        _measurements[stage] = measured
+
+        if UPDATE_BASELINE:
+            return result
+        if stage not in baseline:
+            pytest.fail(f"Sin línea base para '{stage}' (ejecutar con PERF_UPDATE_BASELINE=1)")
+
+        expected = baseline[stage]
+        limits = {
+            'seconds': (TIME_TOLERANCE, TIME_FLOOR_SECONDS),
+            'peak_mb': (MEMORY_TOLERANCE, MEMORY_FLOOR_MB),
+            'arrow_peak_mb': (MEMORY_TOLERANCE, MEMORY_FLOOR_MB),
+            'rss_peak_mb': (MEMORY_TOLERANCE, RSS_FLOOR_MB),
+        }
+        for metric, (tolerance, floor) in limits.items():
+            if metric in expected and metric in measured:
+                _check(stage, metric, measured[metric], expected[metric], tolerance, floor)
+        return result
+
+    return run
+
+
+def pytest_sessionfinish(session, exitstatus):
+    """
+    Con PERF_UPDATE_BASELINE=1 reescribe la línea base con las mediciones de esta sesión
+    """
+    if not UPDATE_BASELINE or not _measurements:
+        return
+    merged = _load_baseline()
+    merged.update(_measurements)
+    with open(BASELINE_PATH, 'w', encoding='utf-8') as f:
+        json.dump(dict(sorted(merged.items())), f, indent=2)
+        f.write('\n')
@@ -0,0 +1,260 @@
+"""
+Verifica que las rutas optimizadas (conteos vectorizados, lectura por bloques,
+caché Feather) producen exactamente lo mismo que las implementaciones de referencia
+"""
+
+import os
+import sqlite3
+
+import pandas as pd
+import pytest
+
+from etl import StockSentimentETL
+from eda import StockSentimentEDA, LazyArrowFrame
+from quality import DataQualityProfiler
+
+
+TOP_COLS = [f'Top{i}' for i in range(1, 26)]
+
+
+@pytest.fixture(scope='module')
+def clean_df(raw_csv):
+    etl = StockSentimentETL(raw_csv)
+    etl.extract()
+    return etl.transform()
+
+
+def test_news_count_matches_rowwise_reference(clean_df):
+    # Implementación original fila a fila
+    expected = clean_df[TOP_COLS].apply(
+        lambda row: sum(1 for val in row if val != ''), axis=1
+    )
+    pd.testing.assert_series_equal(clean_df['News_Count'], expected, check_names=False)
+
+
+def test_transform_output(raw_df, clean_df):
+    assert len(clean_df) == len(raw_df.drop_duplicates().dropna(subset=['Date']))
+    assert clean_df['Date'].is_monotonic_increasing
+    assert clean_df[TOP_COLS].isnull().sum().sum() == 0
+    assert clean_df['Label'].dtype == 'int64'
+    assert (clean_df['Year'] == clean_df['Date'].dt.year).all()
+    assert (clean_df['Quarter'] == clean_df['Date'].dt.quarter).all()
+
+
+def test_profile_csv_chunked_matches_in_memory(raw_csv):
+    in_memory = DataQualityProfiler().profile(pd.read_csv(raw_csv))
+    chunked = DataQualityProfiler().profile_csv(raw_csv, chunksize=300)
+    assert chunked == in_memory
+
+
+def test_profile_csv_detects_latin1_like_extract(tmp_path, raw_df):
+    path = tmp_path / 'latin1.csv'
+    df = raw_df.head(50).copy()
+    df['Top1'] = 'café crème'
+    df.to_csv(path, index=False, encoding='latin-1')
+
+    extracted = StockSentimentETL(str(path)).extract()
+    report = DataQualityProfiler().profile_csv(str(path))
+    assert report == DataQualityProfiler().profile(extracted)
+
+
+def test_reservoir_sample_larger_than_input_is_exact(raw_df):
+    full = DataQualityProfiler().profile(raw_df)
+    sampled = DataQualityProfiler(sample_size=len(raw_df)).profile(raw_df)
+    assert sampled['sample'].pop('sample_size') == len(raw_df)
+    assert full['sample'].pop('sample_size') is None
+    assert sampled == full
+
+
+def test_sampled_report_marks_sample_statistics(raw_df):
+    report = DataQualityProfiler(sample_size=250).profile(raw_df)
+    assert report['total_rows'] == len(raw_df)
+    assert report['sample']['sampled'] is True
+    assert report['sample']['sample_size'] == report['sample']['rows'] == 250
+    assert report['sample']['headlines']['cells'] == 250 * 25
+    assert sum(report['sample']['label']['distribution'].values()) == 250
+
+
+def test_label_nulls_outside_sample_fail_validation(tmp_path, raw_df):
+    broken = raw_df.copy()
+    broken.loc[len(broken) - 1, 'Label'] = None
+    path = tmp_path / 'label_null.csv'
+    broken.to_csv(path, index=False)
+
+    in_memory = DataQualityProfiler(sample_size=50)
+    in_memory.profile(broken)
+    chunked = DataQualityProfiler(sample_size=50)
+    chunked.profile_csv(str(path), chunksize=300)
+
+    for profiler in (in_memory, chunked):
+        report = profiler.report
+        assert report['sample']['sampled'] is True
+        assert report['label'] == {'nulls': 1, 'null_ratio': 1 / len(broken)}
+        assert any(v.startswith('max_label_null_ratio') for v in report['violations'])
+        with pytest.raises(ValueError):
+            profiler.validate()
+
+
+def test_reservoir_sample_is_deterministic_subset(raw_df):
+    profiler = DataQualityProfiler(sample_size=250)
+    chunks = [raw_df.iloc[i:i + 400] for i in range(0, len(raw_df), 400)]
+    sample = profiler._reservoir_sample(iter(chunks))
+    again = DataQualityProfiler(sample_size=250)._reservoir_sample(iter(chunks))
+
+    assert len(sample) == 250
+    pd.testing.assert_frame_equal(sample, again)
+    keys = set(raw_df['Date'].dropna())
+    assert set(sample['Date'].dropna()) <= keys
+
+
+def test_feather_roundtrip_matches_clean(tmp_path, clean_df, raw_csv):
+    etl = StockSentimentETL(raw_csv)
+    etl.df_clean = clean_df
+    etl.load_csv(str(tmp_path / 'clean.csv'))
+    etl.load_feather(str(tmp_path / 'clean.feather'))
+
+    eda = StockSentimentEDA(str(tmp_path / 'clean.csv'), str(tmp_path / 'clean.feather'))
+    eda.output_dir = str(tmp_path / 'viz')
+    eda.load_data()
+    assert isinstance(eda.df, LazyArrowFrame)
+    pd.testing.assert_frame_equal(eda.df.to_pandas(), clean_df)
+
+
+def test_lazy_frame_falls_back_to_dataframe(tmp_path, clean_df, raw_csv):
+    etl = StockSentimentETL(raw_csv)
+    etl.df_clean = clean_df
+    etl.load_feather(str(tmp_path / 'clean.feather'))
+
+    eda = StockSentimentEDA(str(tmp_path / 'clean.csv'))
+    eda.output_dir = str(tmp_path / 'viz')
+    df = eda.load_data()
+    assert isinstance(df, LazyArrowFrame)
+
+    pd.testing.assert_frame_equal(df.head(), clean_df.head())
+    pd.testing.assert_frame_equal(df.describe(), clean_df.describe())
+    pd.testing.assert_series_equal(df.iloc[3], clean_df.iloc[3])
+    df['Double'] = df['News_Count'] * 2
+    assert 'Double' in df and df.shape == (len(clean_df), clean_df.shape[1] + 1)
+    assert (df['Double'] == clean_df['News_Count'] * 2).all()
+
+
+def test_lazy_frame_numeric_columns_share_mapped_memory(tmp_path, clean_df, raw_csv):
+    etl = StockSentimentETL(raw_csv)
+    etl.df_clean = clean_df
+    etl.load_feather(str(tmp_path / 'clean.feather'))
+
+    eda = StockSentimentEDA(str(tmp_path / 'clean.csv'))
+    eda.output_dir = str(tmp_path / 'viz')
+    df = eda.load_data()
+    for col in ['Date', 'Label', 'Year', 'News_Count']:
+        mapped = df._table.column(col).chunk(0).buffers()[1]
+        data = df[col].to_numpy()
+        assert data.__array_interface__['data'][0] == mapped.address, col
+        assert df[col].name == col
+    eda.close()
+
+
+def test_lazy_frame_mask_and_slice_match_dataframe(tmp_path, clean_df, raw_csv):
+    etl = StockSentimentETL(raw_csv)
+    etl.df_clean = clean_df
+    etl.load_feather(str(tmp_path / 'clean.feather'))
+
+    eda = StockSentimentEDA(str(tmp_path / 'clean.csv'))
+    eda.output_dir = str(tmp_path / 'viz')
+    # Cada recarga devuelve un LazyArrowFrame sin materializar
+    fresh = eda.load_data
+
+    pd.testing.assert_frame_equal(fresh()[fresh()['Label'] == 1], clean_df[clean_df['Label'] == 1])
+    pd.testing.assert_frame_equal(fresh()[(clean_df['Label'] == 1).to_numpy()],
+                                  clean_df[clean_df['Label'] == 1])
+    pd.testing.assert_frame_equal(fresh()[1:3], clean_df[1:3])
+    pd.testing.assert_frame_equal(fresh()[lambda d: d['Year'] > 2010], clean_df[clean_df['Year'] > 2010])
+    pd.testing.assert_frame_equal(fresh()[pd.Index(['Date', 'Label'])], clean_df[['Date', 'Label']])
+    with pytest.raises(KeyError):
+        fresh()['Missing']
+    eda.close()
+
+
+def test_close_releases_feather_for_rewrite(tmp_path, clean_df, raw_csv):
+    etl = StockSentimentETL(raw_csv)
+    etl.df_clean = clean_df
+    feather_path = str(tmp_path / 'clean.feather')
+    etl.load_feather(feather_path)
+
+    eda = StockSentimentEDA(str(tmp_path / 'clean.csv'))
+    eda.output_dir = str(tmp_path / 'viz')
+    eda.load_data()
+    source = eda._feather_source
+    eda.load_data()
+    assert source.closed and not eda._feather_source.closed
+
+    eda.close()
+    assert eda._feather_source is None and eda.df is None
+    etl.df_clean = clean_df.head(10)
+    etl.load_feather(feather_path)
+    assert len(eda.load_data()) == 10
+    eda.close()
+
+
+def test_feather_and_csv_sources_agree(tmp_path, clean_df, raw_csv):
+    etl = StockSentimentETL(raw_csv)
+    etl.df_clean = clean_df
+    etl.load_csv(str(tmp_path / 'clean.csv'))
+    etl.load_feather(str(tmp_path / 'clean.feather'))
+
+    lazy = StockSentimentEDA(str(tmp_path / 'clean.csv'), str(tmp_path / 'clean.feather'))
+    plain = StockSentimentEDA(str(tmp_path / 'clean.csv'), use_feather=False)
+    for eda in (lazy, plain):
+        eda.output_dir = str(tmp_path / 'viz')
+        eda.load_data()
+
+    # Columnas que usan las gráficas; los titulares vacíos vuelven del CSV como NaN
+    cols = ['Date', 'Label', 'Year', 'Quarter', 'DayOfWeek', 'News_Count']
+    pd.testing.assert_frame_equal(lazy.df[cols], plain.df[cols], check_dtype=False)
+
+
+def test_stale_feather_falls_back_to_csv(tmp_path, clean_df, raw_csv):
+    etl = StockSentimentETL(raw_csv)
+    etl.df_clean = clean_df
+    feather_path = str(tmp_path / 'clean.feather')
+    csv_path = str(tmp_path / 'clean.csv')
+    etl.load_feather(feather_path)
+    etl.load_csv(csv_path)
+
+    stat = os.stat(csv_path)
+    os.utime(feather_path, (stat.st_atime, stat.st_mtime - 10))
+
+    eda = StockSentimentEDA(csv_path, feather_path)
+    eda.output_dir = str(tmp_path / 'viz')
+    eda.load_data()
+    assert isinstance(eda.df, pd.DataFrame)
+
+
+def test_feather_from_other_dataset_is_ignored(tmp_path, monkeypatch, clean_df, raw_csv):
+    monkeypatch.chdir(tmp_path)
+    etl = StockSentimentETL(raw_csv)
+    etl.df_clean = clean_df.head(45)
+    etl.load_csv('other/clean_b.csv')
+    # Feather de otro dataset en la ruta por defecto, más reciente que el CSV
+    etl.df_clean = clean_df
+    etl.load_feather('data/stock_sentiment_clean.feather')
+
+    eda = StockSentimentEDA('other/clean_b.csv')
+    eda.output_dir = str(tmp_path / 'viz')
+    eda.load_data()
+
+    assert eda.feather_path == os.path.join('other', 'clean_b.feather')
+    assert isinstance(eda.df, pd.DataFrame)
+    assert len(eda.df) == 45
+
+
+def test_sinks_roundtrip(tmp_path, clean_df, raw_csv):
+    etl = StockSentimentETL(raw_csv)
+    etl.df_clean = clean_df
+    etl.load_parquet(str(tmp_path / 'clean.parquet'))
+    etl.load_sqlite(str(tmp_path / 'clean.db'))
+
+    pd.testing.assert_frame_equal(pd.read_parquet(tmp_path / 'clean.parquet'), clean_df)
+    with sqlite3.connect(tmp_path / 'clean.db') as conn:
+        count = conn.execute("SELECT COUNT(*) FROM stock_sentiment").fetchone()[0]
+    assert count == len(clean_df)
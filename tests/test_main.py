@@ -0,0 +1,66 @@
+"""
+Pruebas de extremo a extremo de main.main() sobre los datos sintéticos
+"""
+
+import json
+import os
+import sys
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import main
+
+
+LOAD_OUTPUTS = [
+    'data/stock_sentiment_clean.csv',
+    'data/stock_sentiment_clean.parquet',
+    'data/stock_sentiment_clean.feather',
+    'data/stock_sentiment.db',
+]
+
+PLOT_OUTPUTS = [
+    'visualizations/01_sentiment_distribution.png',
+    'visualizations/02_temporal_trend.png',
+    'visualizations/03_yearly_sentiment.png',
+    'visualizations/04_weekday_pattern.png',
+    'visualizations/05_news_count_distribution.png',
+    'visualizations/06_quarterly_heatmap.png',
+]
+
+
+def test_main_generates_all_outputs(tmp_path, monkeypatch, raw_df, capsys):
+    monkeypatch.chdir(tmp_path)
+    raw_df.to_csv('stock_senti_analysis.csv', index=False)
+
+    main.main()
+
+    out = capsys.readouterr().out
+    assert 'PIPELINE COMPLETADO' in out
+    for path in LOAD_OUTPUTS + PLOT_OUTPUTS + ['data/quality_report.json']:
+        assert os.path.getsize(path) > 0, path
+
+    with open('data/quality_report.json', encoding='utf-8') as f:
+        report = json.load(f)
+    assert report['total_rows'] == len(raw_df)
+    assert report['violations'] == []
+
+
+def test_main_stops_before_loads_on_quality_violation(tmp_path, monkeypatch, raw_df, capsys):
+    monkeypatch.chdir(tmp_path)
+    # Un hueco de ~3 meses en las fechas: transform() lo aceptaría, el perfilado no
+    broken = raw_df.drop(index=np.arange(500, 560))
+    broken.to_csv('stock_senti_analysis.csv', index=False)
+
+    main.main()
+
+    out = capsys.readouterr().out
+    assert 'Error en fase ETL' in out
+    assert 'PIPELINE COMPLETADO' not in out
+    for path in LOAD_OUTPUTS + PLOT_OUTPUTS:
+        assert not os.path.exists(path), path
+
+    with open('data/quality_report.json', encoding='utf-8') as f:
+        report = json.load(f)
+    assert any(v.startswith('max_date_gap_days') for v in report['violations'])
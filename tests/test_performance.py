@@ -0,0 +1,144 @@
+"""
+Presupuestos de tiempo y memoria por etapa del pipeline (ETL + EDA)
+"""
+
+import io
+import time
+
+import matplotlib.pyplot as plt
+import pandas as pd
+import pytest
+
+from etl import StockSentimentETL
+from eda import StockSentimentEDA
+from quality import DataQualityProfiler
+
+
+# Aceleración mínima exigida al conteo vectorizado de News_Count frente al apply fila a fila
+NEWS_COUNT_MIN_SPEEDUP = 3.0
+# Réplicas de los datos limpios para que el conteo fila a fila supere el ruido de medición
+NEWS_COUNT_REPEAT = 10
+
+PLOTS = [
+    'plot_sentiment_distribution',
+    'plot_temporal_trend',
+    'plot_yearly_sentiment',
+    'plot_weekday_pattern',
+    'plot_news_count_distribution',
+    'plot_quarterly_heatmap',
+]
+
+
+@pytest.fixture(scope='module')
+def transformed_etl(raw_csv):
+    etl = StockSentimentETL(raw_csv)
+    etl.extract()
+    etl.transform()
+    return etl
+
+
+@pytest.fixture(scope='module')
+def clean_files(tmp_path_factory, transformed_etl):
+    out = tmp_path_factory.mktemp('clean')
+    csv_path = str(out / 'stock_sentiment_clean.csv')
+    feather_path = str(out / 'stock_sentiment_clean.feather')
+    transformed_etl.load_csv(csv_path)
+    transformed_etl.load_feather(feather_path)
+    return csv_path, feather_path
+
+
+@pytest.fixture(scope='module')
+def warm_matplotlib():
+    # El primer guardado carga fuentes y backend; no debe cargarse a la primera gráfica medida
+    plt.style.use('seaborn-v0_8-darkgrid')
+    fig, ax = plt.subplots()
+    ax.text(0.5, 0.5, 'warm-up', fontweight='bold')
+    fig.savefig(io.BytesIO(), format='png', dpi=300, bbox_inches='tight')
+    plt.close(fig)
+
+
+@pytest.fixture
+def loaded_eda(tmp_path, clean_files, warm_matplotlib):
+    # EDA nuevo por gráfica: cada una paga solo la conversión de sus columnas,
+    # sin depender del orden de ejecución ni de la selección con -k
+    eda = StockSentimentEDA(*clean_files)
+    eda.output_dir = str(tmp_path)
+    eda.load_data()
+    yield eda
+    eda.close()
+
+
+def test_extract(budget, raw_csv):
+    etl = StockSentimentETL(raw_csv)
+    budget('extract', etl.extract)
+
+
+def test_profile(budget, raw_df):
+    profiler = DataQualityProfiler()
+    budget('profile', profiler.profile, raw_df)
+    profiler.validate()
+
+
+def test_transform(budget, raw_csv):
+    etl = StockSentimentETL(raw_csv)
+    etl.extract()
+    budget('transform', etl.transform)
+
+
+def _best_time(func, repeat=3):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def test_news_count_vectorised_speedup(transformed_etl):
+    # Comparación relativa: no depende de la máquina ni de la línea base
+    top_cols = [f'Top{i}' for i in range(1, 26)]
+    df = pd.concat([transformed_etl.df_clean] * NEWS_COUNT_REPEAT, ignore_index=True)
+
+    vectorised = _best_time(lambda: StockSentimentETL._count_news(df, top_cols))
+    rowwise = _best_time(lambda: df[top_cols].apply(
+        lambda row: sum(1 for val in row if val != ''), axis=1))
+
+    assert rowwise / vectorised >= NEWS_COUNT_MIN_SPEEDUP, (
+        f"News_Count vectorizado {vectorised:.3f}s vs fila a fila {rowwise:.3f}s "
+        f"({rowwise / vectorised:.1f}x < {NEWS_COUNT_MIN_SPEEDUP}x)")
+
+
+def test_load_csv(budget, transformed_etl, tmp_path):
+    budget('load_csv', transformed_etl.load_csv, str(tmp_path / 'clean.csv'))
+
+
+def test_load_parquet(budget, transformed_etl, tmp_path):
+    budget('load_parquet', transformed_etl.load_parquet, str(tmp_path / 'clean.parquet'))
+
+
+def test_load_feather(budget, transformed_etl, tmp_path):
+    budget('load_feather', transformed_etl.load_feather, str(tmp_path / 'clean.feather'))
+
+
+def test_load_sqlite(budget, transformed_etl, tmp_path):
+    budget('load_sqlite', transformed_etl.load_sqlite, str(tmp_path / 'clean.db'))
+
+
+def test_eda_load_data_feather(budget, clean_files, tmp_path):
+    eda = StockSentimentEDA(*clean_files)
+    eda.output_dir = str(tmp_path)
+    try:
+        budget('eda_load_data_feather', eda.load_data)
+    finally:
+        eda.close()
+
+
+def test_eda_load_data_csv(budget, clean_files, tmp_path):
+    eda = StockSentimentEDA(clean_files[0], use_feather=False)
+    eda.output_dir = str(tmp_path)
+    budget('eda_load_data_csv', eda.load_data)
+
+
+@pytest.mark.parametrize('plot', PLOTS)
+def test_plot(budget, loaded_eda, plot):
+    budget(plot, getattr(loaded_eda, plot))